@@ -13,7 +13,10 @@ class ModelBase(PdmVModelBase):
     """
 
     cmssw_check = regex('CMSSW_[0-9]{1,3}_[0-9]{1,3}_[0-9]{1,3}.{0,20}')
+    conditions_check = regex('[a-zA-Z0-9_]{0,50}')
+    config_id_check = regex('[a-f0-9]{0,50}')
     dataset_check = regex('^/[a-zA-Z0-9\\-_]{1,99}/[a-zA-Z0-9\\.\\-_]{1,199}/[A-Z\\-]{1,50}$')
+    era_check = regex('[a-zA-Z0-9_\\,]{0,50}')
     processing_string_check = regex('[a-zA-Z0-9_]{1,100}')
     request_id_check = regex('[a-zA-Z0-9\\-_]{1,100}')
     runs_json_path_check = regex('[a-zA-Z0-9/\\-_]{0,150}(\\.json|\\.txt)?')
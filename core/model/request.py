@@ -87,8 +87,11 @@ class Request(ModelBase):
 
     def __init__(self, json_input=None, check_attributes=True):
         if json_input:
-            json_input = deepcopy(json_input)
-            json_input['runs'] = [int(r) for r in json_input.get('runs', [])]
+            runs = json_input.get('runs', [])
+            # Runs are rebuilt below, so there is no need to deep copy them
+            json_input = {k: deepcopy(v) for k, v in json_input.items() if k != 'runs'}
+            # Remove duplicate runs, keep order in which they were given
+            json_input['runs'] = list(dict.fromkeys(int(r) for r in runs))
             sequence_objects = []
             for sequence_json in json_input.get('sequences', []):
                 sequence_objects.append(Sequence(json_input=sequence_json,
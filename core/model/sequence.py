@@ -2,9 +2,20 @@
 Module that contains Sequence class
 """
 import weakref
+from copy import deepcopy
+from functools import lru_cache
 from core.model.model_base import ModelBase
 
 
+@lru_cache(maxsize=16)
+def sorted_keys(keys):
+    """
+    Return a sorted tuple of given frozenset of keys
+    cmsDriver arguments have the same keys most of the time, so cache results
+    """
+    return tuple(sorted(keys))
+
+
 class Sequence(ModelBase):
     """
     Sequence is a dictionary that has all user editable attributes
@@ -49,11 +60,11 @@ class Sequence(ModelBase):
         'step': []}
 
     lambda_checks = {
-        'conditions': lambda c: ModelBase.matches_regex(c, '[a-zA-Z0-9_]{0,50}'),
-        'config_id': lambda cid: ModelBase.matches_regex(cid, '[a-f0-9]{0,50}'),
+        'conditions': ModelBase.conditions_check,
+        'config_id': ModelBase.config_id_check,
         '__datatier': lambda s: s in {'ALCARECO', 'AOD', 'DQMIO', 'MINIAOD',
                                       'NANOAOD', 'RECO', 'USER'},
-        'era': lambda e: ModelBase.matches_regex(e, '[a-zA-Z0-9_\\,]{0,50}'),
+        'era': ModelBase.era_check,
         '__eventcontent': lambda s: s in {'ALCARECO', 'AOD', 'DQM', 'MINIAOD',
                                           'NANOAOD', 'NANOEDMAOD', 'RECO', 'FEVT',
                                           'FEVTDEBUG', 'FEVTDEBUGHLT'},
@@ -62,7 +73,7 @@ class Sequence(ModelBase):
             'cuda_capabilities': lambda l: isinstance(l, list),
             'gpu_memory': lambda m: m == '' or int(m) > 0,
         },
-        'harvesting_config_id': lambda cid: ModelBase.matches_regex(cid, '[a-f0-9]{0,50}'),
+        'harvesting_config_id': ModelBase.config_id_check,
         'nThreads': lambda n: 0 < n < 64,
         'scenario': lambda s: s in {'pp', 'cosmics', 'nocoll', 'HeavyIons'},
         '__step': lambda s: (s.split(':')[0] in {'ALCA', 'DQM', 'EI', 'FILTER', 'HARVESTING',
@@ -74,7 +85,8 @@ class Sequence(ModelBase):
         self.parent = None
         if json_input:
             if json_input.get('gpu', {}).get('requires') not in ('optional', 'required'):
-                json_input['gpu'] = self.schema().get('gpu')
+                # Copy only the default GPU dictionary instead of whole schema
+                json_input['gpu'] = deepcopy(Sequence._ModelBase__schema['gpu'])
                 json_input['gpu']['requires'] = 'forbidden'
 
         ModelBase.__init__(self, json_input, check_attributes)
@@ -118,11 +130,7 @@ class Sequence(ModelBase):
             # Parent request has harvesting disabled
             return False
 
-        for step in self.get('step'):
-            if step == 'DQM' or step.startswith('DQM:'):
-                return True
-
-        return False
+        return any(s == 'DQM' or s.startswith('DQM:') for s in self.get('step'))
 
     def get_index_in_parent(self):
         """
@@ -148,21 +156,30 @@ class Sequence(ModelBase):
         If there is only one sequence, it will be the last one
         and have the same name as parent prepid
         """
-        index = self.get_index_in_parent()
-        parent_prepid = self.parent().get_prepid()
-        if index != len(self.parent().get('sequences')) - 1:
-            sequence_name = f'{parent_prepid}_{index}'
-        else:
-            sequence_name = f'{parent_prepid}'
+        return self.__get_name(self.get_index_in_parent())
 
-        return sequence_name
+    def __get_name(self, index):
+        """
+        Return a sequence name for a given index in parent
+        """
+        parent = self.parent()
+        parent_prepid = parent.get_prepid()
+        if index != len(parent.get('sequences')) - 1:
+            return f'{parent_prepid}_{index}'
+
+        return parent_prepid
 
     def get_config_file_names(self):
         """
         Return dictionary of 'config' and 'harvest' config file names
         """
+        return self.__get_config_file_names(self.get_index_in_parent())
+
+    def __get_config_file_names(self, index):
+        """
+        Return dictionary of config file names for a given index in parent
+        """
         parent_prepid = self.parent().get_prepid()
-        index = self.get_index_in_parent()
         config_file_names = {'config': f'{parent_prepid}_{index}_cfg'}
         if self.needs_harvesting():
             config_file_names['harvest'] = f'{parent_prepid}_{index}_harvest_cfg'
@@ -176,34 +193,35 @@ class Sequence(ModelBase):
         """
         self.logger.info('Generating %s cmsDriver', cmsdriver_type)
         # Actual command
-        command = f'# Command for {cmsdriver_type}:\ncmsDriver.py {cmsdriver_type}'
+        command = [f'# Command for {cmsdriver_type}:\ncmsDriver.py {cmsdriver_type}']
         # Comment in front of the command for better readability
-        comment = f'# Arguments for {cmsdriver_type}:\n'
-        for key in sorted(arguments.keys()):
-            if not arguments[key]:
+        comment = [f'# Arguments for {cmsdriver_type}:\n']
+        for key in sorted_keys(frozenset(arguments)):
+            value = arguments[key]
+            if not value:
                 continue
 
             if key in 'extra':
                 continue
 
-            if isinstance(arguments[key], bool):
-                arguments[key] = ''
-
-            if isinstance(arguments[key], list):
-                arguments[key] = ','.join([str(x) for x in arguments[key]])
+            # Do not change given arguments dictionary
+            if isinstance(value, bool):
+                value = ''
+            elif isinstance(value, list):
+                value = ','.join(map(str, value))
 
-            command += f' --{key} {arguments[key]}'.rstrip()
-            comment += f'# --{key} {arguments[key]}'.rstrip() + '\n'
+            command.append(f' --{key} {value}'.rstrip())
+            comment.append(f'# --{key} {value}'.rstrip() + '\n')
 
         if arguments.get('extra'):
             extra_value = arguments['extra']
-            command += f' {extra_value}'
-            comment += f'# <extra> {extra_value}\n'
+            command.append(f' {extra_value}')
+            comment.append(f'# <extra> {extra_value}\n')
 
         # Exit the script with error of cmsDriver.py
-        command += ' || exit $?'
+        command.append(' || exit $?')
 
-        return comment + '\n' + command
+        return ''.join(comment) + '\n' + ''.join(command)
 
     def get_cmsdriver(self, overwrite_input=None):
         """
@@ -211,7 +229,9 @@ class Sequence(ModelBase):
         Config file is named like this
         PrepID_0_cfg.py
         """
-        sequence_name = self.get_name()
+        # Index lookup goes through all parent's sequences, so do it only once
+        index = self.get_index_in_parent()
+        sequence_name = self.__get_name(index)
         arguments_dict = dict(self.get_json())
         # Delete sequence metadata
         arguments_dict.pop('config_id', None)
@@ -224,7 +244,6 @@ class Sequence(ModelBase):
         if overwrite_input:
             arguments_dict['filein'] = overwrite_input
         else:
-            index = self.get_index_in_parent()
             arguments_dict['number'] = 10
             if index == 0:
                 input_dataset = self.parent().get('input')['dataset']
@@ -247,15 +266,15 @@ class Sequence(ModelBase):
                 else:
                     arguments_dict['filein'] = f'"dbs:{input_dataset}"'
             else:
-                previous_sequence = self.parent().get('sequences')[index - 1]
-                input_file = f'{previous_sequence.get_name()}.root'
+                # Previous sequence has the same parent, so its name depends only on index
+                input_file = f'{self.__get_name(index - 1)}.root'
                 arguments_dict['filein'] = f'"file:{input_file}"'
 
         # Update ALCA and SKIM steps to ALCA:@Dataset and SKIM:@Dataset
         # if dataset name is in "auto" dictionary in CMSSW
         dynamic_steps = self.update_dynamic_steps(arguments_dict['step'])
         # Build argument dictionary
-        config_names = self.get_config_file_names()
+        config_names = self.__get_config_file_names(index)
         arguments_dict['fileout'] = f'"file:{sequence_name}.root"'
         arguments_dict['python_filename'] = f'"{config_names["config"]}.py"'
         arguments_dict['no_exec'] = True
@@ -305,15 +324,14 @@ class Sequence(ModelBase):
 
         # Get correct configuration of DQM step, e.g.
         # DQM:@rerecoCommon should be changed to HARVESTING:@rerecoCommon
-        step = 'HARVESTING:dqmHarvesting'
-        for one_step in self.get('step'):
-            if one_step.startswith('DQM:'):
-                step = one_step.replace('DQM:', 'HARVESTING:', 1)
-                break
+        step = next((s.replace('DQM:', 'HARVESTING:', 1) for s in self.get('step')
+                     if s.startswith('DQM:')),
+                    'HARVESTING:dqmHarvesting')
 
         # Build argument dictionary
-        sequence_name = self.get_name()
-        config_names = self.get_config_file_names()
+        index = self.get_index_in_parent()
+        sequence_name = self.__get_name(index)
+        config_names = self.__get_config_file_names(index)
         arguments_dict['data'] = True
         arguments_dict['no_exec'] = True
         arguments_dict['filetype'] = 'DQM'
@@ -0,0 +1,32 @@
+"""
+Gunicorn configuration for production ReReco server
+Host and port are taken from the same config file section as wsgi.py uses
+"""
+import sys
+import os
+# Gunicorn reads this file before changing working directory to the app
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from core_lib.utils.global_config import Config
+
+
+def get_bind():
+    """
+    Return host:port from ReReco config file
+    Config is not kept in a module variable, because gunicorn treats every
+    top level name in this file as its setting and "config" is one of them
+    """
+    rereco_config = Config.load(os.getenv('RERECO_CONFIG', 'config.cfg'),
+                                os.getenv('RERECO_MODE', 'prod'))
+    host = rereco_config.get('host', '0.0.0.0')
+    port = int(rereco_config.get('port', 8002))
+    return f'{host}:{port}'
+
+
+#pylint: disable=invalid-name
+bind = get_bind()
+# Single worker process, because locks and submission queue are kept in memory
+workers = 1
+worker_class = 'gthread'
+threads = 8
+pidfile = 'rereco.pid'
+#pylint: enable=invalid-name
@@ -9,7 +9,7 @@ import logging.handlers
 import argparse
 from flask_restful import Api
 from flask_cors import CORS
-from flask import Flask, render_template
+from flask import Flask, render_template, request
 from jinja2.exceptions import TemplateNotFound
 from core_lib.database.database import Database
 from core_lib.utils.global_config import Config
@@ -74,6 +74,22 @@ CORS(app,
      supports_credentials=True)
 
 
+@app.after_request
+def add_etag(response):
+    """
+    Add ETag to successful API GET responses and reply with 304 Not Modified
+    if client already has the same response
+    """
+    if (request.method == 'GET'
+            and request.path.startswith('/api/')
+            and response.status_code == 200
+            and not response.direct_passthrough):
+        response.add_etag()
+        response.make_conditional(request)
+
+    return response
+
+
 @app.route('/', defaults={'_path': ''})
 @app.route('/<path:_path>')
 def catch_all(_path):
@@ -211,23 +227,11 @@ def setup_logging(debug):
     logger.addHandler(handler)
     return logger
 
-def main():
+
+def setup_database(config):
     """
-    Main function: start Flask web server
+    Setup database name, credentials and search attribute renames
     """
-    parser = argparse.ArgumentParser(description='ReReco Machine')
-    parser.add_argument('--mode',
-                        help='Use production (prod) or development (dev) section of config',
-                        choices=['prod', 'dev'],
-                        required=True)
-    parser.add_argument('--config',
-                        default='config.cfg',
-                        help='Specify non standard config file name')
-    parser.add_argument('--debug',
-                        help='Run Flask in debug mode',
-                        action='store_true')
-    args = vars(parser.parse_args())
-    config = Config.load(args.get('config'), args.get('mode'))
     database_auth = config.get('database_auth')
 
     Database.set_database_name('rereco')
@@ -250,6 +254,27 @@ def main():
     Database.add_search_rename('tickets', 'subcampaign', 'steps.subcampaign')
     Database.add_search_rename('tickets', 'processing_string', 'steps.processing_string')
 
+
+def main():
+    """
+    Main function: start Flask development web server
+    For production use a WSGI server with wsgi.py
+    """
+    parser = argparse.ArgumentParser(description='ReReco Machine')
+    parser.add_argument('--mode',
+                        help='Use production (prod) or development (dev) section of config',
+                        choices=['prod', 'dev'],
+                        required=True)
+    parser.add_argument('--config',
+                        default='config.cfg',
+                        help='Specify non standard config file name')
+    parser.add_argument('--debug',
+                        help='Run Flask in debug mode',
+                        action='store_true')
+    args = vars(parser.parse_args())
+    config = Config.load(args.get('config'), args.get('mode'))
+    setup_database(config)
+
     debug = args.get('debug', False)
     port = int(config.get('port', 8002))
     host = config.get('host', '0.0.0.0')
@@ -27,6 +27,6 @@ fi
 
 if [ "$CMD" = "start" ]; then
   echo "Starting ReReco"
-  nohup python3 $(pwd)/main.py --mode prod &
+  RERECO_MODE=prod nohup gunicorn --config gunicorn.conf.py wsgi:app &
   echo "Started with pid $!"
 fi
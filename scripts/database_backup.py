@@ -5,6 +5,10 @@ import sys
 import json
 import os
 import argparse
+try:
+    import orjson
+except ImportError:
+    orjson = None
 sys.path.append(os.path.abspath(os.path.pardir))
 from core_lib.database.database import Database
 from core_lib.utils.global_config import Config
@@ -34,8 +38,13 @@ def dump_documents(database_auth, output_dir, database_name, collections):
                 break
 
             file_name = f'{collection_path}/{database_name}_{collection_name}_{page}.json'
-            with open(file_name, 'w') as output_file:
-                json.dump(documents, output_file)
+            if orjson:
+                # orjson is much faster for big dumps, but it is optional
+                with open(file_name, 'wb') as output_file:
+                    output_file.write(orjson.dumps(documents))
+            else:
+                with open(file_name, 'w') as output_file:
+                    json.dump(documents, output_file)
 
             print('Page %s done' % (page))
             page += 1
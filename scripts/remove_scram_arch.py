@@ -4,6 +4,8 @@ Script to remove scram arch attribute from subcampaigns and requests
 import sys
 import os.path
 import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pymongo import ReplaceOne
 sys.path.append(os.path.abspath(os.path.pardir))
 from core_lib.database.database import Database
 
@@ -19,17 +21,59 @@ total_requests = request_db.get_count()
 print('Requests: %s' % (total_requests))
 print('Subcampaigns: %s' % (total_subcampaigns))
 
-for index, subcampaign in enumerate(subcampaign_db.query(limit=total_subcampaigns)):
-    print('Processing subcampaign %s/%s %s' % (index + 1,
-                                               total_subcampaigns,
-                                               subcampaign['prepid']))
-    subcampaign.pop('scram_arch', None)
-    subcampaign_db.save(subcampaign)
-
-for index, request in enumerate(request_db.query(limit=total_requests)):
-    print('Processing request %s/%s %s' % (index + 1, total_requests, request['prepid']))
-    request.pop('scram_arch', None)
-    request_db.save(request)
+BATCH_SIZE = 500
+MAX_WORKERS = 8
+
+
+def bulk_save(database, documents):
+    """
+    Save a list of documents to the database in a single bulk write
+    """
+    if not documents:
+        return
+
+    database.collection.bulk_write([ReplaceOne({'_id': d['_id']}, d) for d in documents],
+                                   ordered=False)
+
+
+def remove_scram_arch(database, pool):
+    """
+    Remove scram_arch from all documents in the database and save changed
+    documents in batches
+    Batches are saved in the pool while cursor keeps reading next documents
+    """
+    # Only documents that still have scram_arch need to be changed, so on
+    # repeated runs nothing is read or written back
+    query = {'scram_arch': {'$exists': True}}
+    total = database.collection.count_documents(query)
+    pending = set()
+    batch = []
+    # Iterate a cursor instead of loading whole collection into memory
+    documents = database.collection.find(query).batch_size(BATCH_SIZE)
+    for index, document in enumerate(documents):
+        print('Processing %s/%s %s' % (index + 1, total, document['prepid']))
+        document.pop('scram_arch')
+        batch.append(document)
+        if len(batch) == BATCH_SIZE:
+            if len(pending) >= MAX_WORKERS:
+                # Do not read further than there are workers to save batches,
+                # so only a few batches are kept in memory at a time
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+
+            pending.add(pool.submit(bulk_save, database, batch))
+            batch = []
+
+    pending.add(pool.submit(bulk_save, database, batch))
+    # Wait for remaining batches and raise exception if any of them failed
+    for future in pending:
+        future.result()
+
+
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    remove_scram_arch(subcampaign_db, executor)
+    remove_scram_arch(request_db, executor)
 
 
 total_subcampaigns = subcampaign_db.get_count()
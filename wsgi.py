@@ -0,0 +1,17 @@
+"""
+Module that exposes Flask application for a production WSGI server, e.g.
+gunicorn --config gunicorn.conf.py wsgi:app
+Config file name and section are taken from RERECO_CONFIG and RERECO_MODE
+environment variables
+"""
+import os
+from core_lib.utils.global_config import Config
+#pylint: disable=unused-import
+from main import app, setup_database, setup_logging
+#pylint: enable=unused-import
+
+
+config = Config.load(os.getenv('RERECO_CONFIG', 'config.cfg'), os.getenv('RERECO_MODE', 'prod'))
+setup_database(config)
+logger = setup_logging(False)
+logger.info('Starting WSGI application, PID: %s', os.getpid())